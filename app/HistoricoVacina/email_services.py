@@ -1,17 +1,29 @@
 """Módulo de serviços de e-mail."""
 import smtplib
 import os
+import string
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from dotenv import load_dotenv
 import logging
 
-# Carrega variáveis de ambiente
-load_dotenv()
-
-# Configura logging
+# A configuração do logging fica a cargo do entrypoint da aplicação
 logger = logging.getLogger("email_service")
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+# Template estático do e-mail de confirmação, compilado uma única vez
+_HTML_TPL = string.Template("""
+<html>
+<body style="font-family: Arial, sans-serif; color: #333;">
+    <h2 style="color: #2b6cb0;">Olá, $nome!</h2>
+    <p>Seu registro da vacina <strong>$vacina</strong> aplicada em <strong>$data</strong> foi adicionado com sucesso ao sistema ImuneTrack.</p>
+    <p>Mantenha seu histórico vacinal sempre atualizado!</p>
+    <hr style="border:none;border-top:1px solid #ccc;">
+    <small style="color: #555;">Este é um e-mail automático. Não responda.</small>
+</body>
+</html>
+""")
 
 class EmailService:
     """Serviço para envio de e-mails."""
@@ -22,41 +34,54 @@ class EmailService:
         self.user = os.getenv("EMAIL_USER")
         self.password = os.getenv("EMAIL_PASS")
         self.email_from = os.getenv("EMAIL_FROM", self.user)
+        # Conexão SMTP persistente, protegida por lock para uso concorrente
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _get_conn(self):
+        """Retorna a conexão SMTP persistente, reconectando se necessário."""
+        if self._conn is not None:
+            try:
+                self._conn.noop()
+                return self._conn
+            except (smtplib.SMTPException, OSError):
+                self._conn = None
+        conn = smtplib.SMTP(self.host, self.port)
+        conn.starttls()
+        conn.login(self.user, self.password)
+        self._conn = conn
+        return conn
 
     def enviar_confirmacao_vacina(self, destinatario, nome_usuario, vacina, data):
         """Envia e-mail de confirmação de registro de vacina."""
         assunto = f"Confirmação de Registro - {vacina}"
 
-        # Corpo HTML
-        html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; color: #333;">
-            <h2 style="color: #2b6cb0;">Olá, {nome_usuario}!</h2>
-            <p>Seu registro da vacina <strong>{vacina}</strong> aplicada em <strong>{data}</strong> foi adicionado com sucesso ao sistema ImuneTrack.</p>
-            <p>Mantenha seu histórico vacinal sempre atualizado!</p>
-            <hr style="border:none;border-top:1px solid #ccc;">
-            <small style="color: #555;">Este é um e-mail automático. Não responda.</small>
-        </body>
-        </html>
-        """
+        # Corpo HTML: apenas substitui as variáveis no template pré-compilado
+        html = _HTML_TPL.substitute(nome=nome_usuario, vacina=vacina, data=data)
 
         msg = MIMEMultipart("alternative")
         msg["Subject"] = assunto
         msg["From"] = self.email_from
         msg["To"] = destinatario
 
-        msg.attach(MIMEText(html, "html"))
+        msg.attach(MIMEText(html, "html", "utf-8"))
 
         try:
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.starttls()
-                server.login(self.user, self.password)
-                server.send_message(msg)
-                logger.info(f"E-mail enviado para {destinatario}")
+            with self._lock:
+                self._get_conn().send_message(msg)
+            logger.info(f"E-mail enviado para {destinatario}")
             return True
         except Exception as e:
+            self._conn = None
             logger.error(f"Falha ao enviar e-mail para {destinatario}: {e}")
             return False
 
-# Instância global
-email_service = EmailService()
+@lru_cache
+def get_email_service() -> EmailService:
+    """Retorna a instância única do serviço de e-mail, criada sob demanda.
+
+    O primeiro uso carrega o .env e lê as variáveis de ambiente; chamadas
+    seguintes reutilizam a mesma instância (e a conexão SMTP persistente).
+    """
+    load_dotenv()
+    return EmailService()
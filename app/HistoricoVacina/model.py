@@ -1,8 +1,8 @@
 """ Modelo de Histórico Vacinal """
-from datetime import datetime
 import enum
 
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Enum, Index, Text
+from sqlalchemy import func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -23,21 +23,52 @@ class HistoricoVacinal(Base):
     usuario_id = Column(Integer, ForeignKey('usuarios.id'), nullable=False)
     vacina_id = Column(Integer, ForeignKey('vacinas.id'), nullable=False)
     numero_dose = Column(Integer, nullable=False)
-    status = Column(Enum(StatusDose), default=StatusDose.PENDENTE, nullable=False)
+    # native_enum usa o tipo ENUM do Postgres (comparação barata e coluna
+    # menor que string); no SQLite cai em VARCHAR + CHECK
+    status = Column(
+        Enum(StatusDose, name="status_dose", native_enum=True),
+        default=StatusDose.PENDENTE, nullable=False
+    )
     data_aplicacao = Column(Date, nullable=True)
     data_prevista = Column(Date, nullable=True)
     lote = Column(String(50), nullable=True)
     local_aplicacao = Column(String(100), nullable=True)
     profissional = Column(String(100), nullable=True)
     observacoes = Column(Text, nullable=True)
-    created_at = Column(Date, default=datetime.utcnow, nullable=False)
-    updated_at = Column(Date, default=datetime.utcnow,
-    onupdate=datetime.utcnow, nullable=False)
+    # Timestamps preenchidos pelo banco: sem chamada Python por INSERT e
+    # com precisão de horário, para o desempate por created_at na listagem
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(),
+    onupdate=func.now(), nullable=False)
+
+    # Busca os defaults do servidor no próprio INSERT (RETURNING), já que
+    # as respostas usam created_at sem refresh após o commit
+    __mapper_args__ = {"eager_defaults": True}
 
     # Relacionamentos
     vacina = relationship("Vacina", back_populates="historico_vacinal")
     usuario = relationship("Usuario", back_populates="historico_vacinal")
 
+    __table_args__ = (
+        # Índices compostos para as consultas filtradas por usuário; o
+        # primeiro segue a ordenação de listar_por_usuario para o ORDER BY
+        # consumir o índice sem etapa de sort
+        Index("ix_hv_user_data_apl", usuario_id, data_aplicacao.desc(), created_at.desc()),
+        Index("ix_hv_user_status_prev", "usuario_id", "status", "data_prevista"),
+        Index("ix_hv_user_vacina", "usuario_id", "vacina_id"),
+        Index("ix_hv_status_user", "status", "usuario_id"),
+    )
+
+    @property
+    def vacina_nome(self):
+        """Nome da vacina associada, para os schemas de resposta."""
+        return self.vacina.nome if self.vacina else None
+
+    @property
+    def vacina_doses_totais(self):
+        """Total de doses da vacina associada, para os schemas de resposta."""
+        return self.vacina.doses if self.vacina else None
+
     def __repr__(self) -> str:
         return (f"<HistoricoVacinal(id={self.id}, usuario_id={self.usuario_id}, "
                 f"vacina_id={self.vacina_id}, dose={self.numero_dose}, status='{self.status}')>")
@@ -2,7 +2,7 @@
 from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status, HTTPException, Path
+from fastapi import APIRouter, BackgroundTasks, Depends, status, HTTPException, Path
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -14,10 +14,11 @@ from app.schemas import (
     HistoricoVacinalCompleto,
     EstatisticasHistorico,
     ErrorResponse,
+    MessageResponse,
     StatusDoseEnum
 )
 from app.HistoricoVacina.controller import HistoricoVacinalController
-from app.HistoricoVacina.model import StatusDose
+from app.HistoricoVacina.email_services import get_email_service
 from app.Usuario.model import Usuario
 
 router = APIRouter(prefix="/{usuario_id}/historico", tags=["Histórico Vacinal"])
@@ -36,6 +37,10 @@ class DadosAplicacao(BaseModel):
     local_aplicacao: Optional[str] = Field(None, description="Local onde foi aplicada")
     profissional: Optional[str] = Field(None, description="Nome do profissional")
 
+class DadosAplicacaoLote(DadosAplicacao):
+    """Modelo para aplicação de várias doses de uma vez."""
+    historico_ids: List[int] = Field(..., description="IDs dos registros a marcar como aplicados")
+
 # Listar histórico vacinal com filtros
 @router.get(
     "/",
@@ -44,7 +49,7 @@ class DadosAplicacao(BaseModel):
     summary="Listar histórico vacinal do usuário",
     description="Retorna o histórico vacinal completo do usuário com filtros opcionais"
 )
-async def listar_historico(
+def listar_historico(
     usuario_id: int = Path(..., description="ID do usuário"),
     filtros: FiltrosHistorico = Depends(),
     db: Session = Depends(get_db)
@@ -59,27 +64,8 @@ async def listar_historico(
         status_filtro=filtros.status_filtro
     )
 
-    resultado = []
-    for h in historico:
-        resultado.append({
-            "id": h.id,
-            "usuario_id": h.usuario_id,
-            "vacina_id": h.vacina_id,
-            "vacina_nome": h.vacina.nome,
-            "vacina_doses_totais": h.vacina.doses,
-            "numero_dose": h.numero_dose,
-            "status": h.status,
-            "data_aplicacao": h.data_aplicacao,
-            "data_prevista": h.data_prevista,
-            "lote": h.lote,
-            "local_aplicacao": h.local_aplicacao,
-            "profissional": h.profissional,
-            "observacoes": h.observacoes,
-            "created_at": h.created_at,
-            "updated_at": h.updated_at
-        })
-
-    return resultado
+    # O controller já devolve dicionários prontos para serialização
+    return historico
 
 
 @router.get(
@@ -89,7 +75,7 @@ async def listar_historico(
     summary="Obter estatísticas do histórico vacinal",
     description="Retorna estatísticas e resumo do histórico vacinal do usuário"
 )
-async def obter_estatisticas(
+def obter_estatisticas(
     usuario_id: int,
     db: Session = Depends(get_db)
 ):
@@ -108,7 +94,7 @@ async def obter_estatisticas(
 )
 
 # pylint: disable=duplicate-code
-async def buscar_registro(
+def buscar_registro(
     usuario_id: int,
     historico_id: int,
     db: Session = Depends(get_db)
@@ -121,23 +107,7 @@ async def buscar_registro(
             detail=f"Registro com ID {historico_id} não encontrado"
         )
 
-    return {
-        "id": historico.id,
-        "usuario_id": historico.usuario_id,
-        "vacina_id": historico.vacina_id,
-        "vacina_nome": historico.vacina.nome,
-        "vacina_doses_totais": historico.vacina.doses,
-        "numero_dose": historico.numero_dose,
-        "status": historico.status,
-        "data_aplicacao": historico.data_aplicacao,
-        "data_prevista": historico.data_prevista,
-        "lote": historico.lote,
-        "local_aplicacao": historico.local_aplicacao,
-        "profissional": historico.profissional,
-        "observacoes": historico.observacoes,
-        "created_at": historico.created_at,
-        "updated_at": historico.updated_at
-    }
+    return historico
 
 
 @router.post(
@@ -148,15 +118,16 @@ async def buscar_registro(
     summary="Adicionar registro ao histórico vacinal",
     description="Cria um novo registro de dose no histórico vacinal do usuário"
 )
-async def criar_registro(
+def criar_registro(
     usuario_id: int,
     historico_data: HistoricoVacinalCreate,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Cria um novo registro de histórico vacinal e envia e-mail de confirmação."""
 
-    # Verifica se o usuário existe
-    usuario = db.query(Usuario).filter(Usuario.id == usuario_id).first()
+    # Verifica se o usuário existe (fica no identity map para o controller)
+    usuario = db.get(Usuario, usuario_id)
     if not usuario:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
 
@@ -167,22 +138,19 @@ async def criar_registro(
         historico_data=historico_data,
     )
 
-    return {
-        "id": novo_registro.id,
-        "usuario_id": novo_registro.usuario_id,
-        "vacina_id": novo_registro.vacina_id,
-        "vacina_nome": novo_registro.vacina.nome,
-        "numero_dose": novo_registro.numero_dose,
-        "status": novo_registro.status,
-        "data_aplicacao": novo_registro.data_aplicacao,
-        "data_prevista": novo_registro.data_prevista,
-        "lote": novo_registro.lote,
-        "local_aplicacao": novo_registro.local_aplicacao,
-        "profissional": novo_registro.profissional,
-        "observacoes": novo_registro.observacoes,
-        "created_at": novo_registro.created_at,
-        "updated_at": novo_registro.updated_at,
-    }
+    # Agenda o envio do e-mail fora do caminho da requisição, para a
+    # resposta não esperar pelo round-trip SMTP
+    data_referencia = historico_data.data_aplicacao or historico_data.data_prevista
+    if data_referencia:
+        background_tasks.add_task(
+            get_email_service().enviar_confirmacao_vacina,
+            destinatario=usuario.email,
+            nome_usuario=usuario.nome,
+            vacina=novo_registro.vacina.nome,
+            data=data_referencia.strftime("%d/%m/%Y")
+        )
+
+    return novo_registro
 
 
 @router.put(
@@ -201,18 +169,17 @@ async def criar_registro(
     summary="Atualizar registro do histórico",
     description="Atualiza um registro existente no histórico vacinal"
 )
-async def atualizar_registro(
+def atualizar_registro(
     usuario_id: int,
     historico_id: int,
     historico: HistoricoVacinalUpdate,
     db: Session = Depends(get_db)
 ):
     """Atualiza um registro do histórico."""
+    # StatusDoseEnum é o próprio StatusDose do modelo, então o status já
+    # chega validado no tipo certo — sem reconversão aqui
     update_data = historico.model_dump(exclude_unset=True)
 
-    if 'status' in update_data and update_data['status'] is not None:
-        update_data['status'] = StatusDose(update_data['status'].value)
-
     registro_atualizado = HistoricoVacinalController.atualizar_registro(
         db=db,
         historico_id=historico_id,
@@ -228,6 +195,38 @@ async def atualizar_registro(
 
     return registro_atualizado
 
+@router.patch(
+    "/aplicar-lote",
+    response_model=MessageResponse,
+    status_code=status.HTTP_200_OK,
+    responses={404: {"model": ErrorResponse}},
+    summary="Marcar várias doses como aplicadas",
+    description="Marca vários registros como aplicados em uma única atualização"
+)
+def marcar_lote_como_aplicado(
+    usuario_id: int,
+    dados: DadosAplicacaoLote,
+    db: Session = Depends(get_db)
+):
+    """Marca várias doses como aplicadas com um único UPDATE no banco."""
+    atualizados = HistoricoVacinalController.marcar_doses_como_aplicadas(
+        db=db,
+        usuario_id=usuario_id,
+        historico_ids=dados.historico_ids,
+        data_aplicacao=dados.data_aplicacao,
+        lote=dados.lote,
+        local_aplicacao=dados.local_aplicacao,
+        profissional=dados.profissional
+    )
+
+    if atualizados == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Nenhum registro encontrado para os IDs informados"
+        )
+
+    return {"message": f"{atualizados} registro(s) marcado(s) como aplicado(s)"}
+
 @router.patch(
     "/{historico_id}/aplicar",
     response_model=HistoricoVacinalResponse,
@@ -236,7 +235,7 @@ async def atualizar_registro(
     summary="Marcar dose como aplicada",
     description="Marca uma dose pendente como aplicada com informações da aplicação"
 )
-async def marcar_como_aplicada(
+def marcar_como_aplicada(
     usuario_id: int,
     historico_id: int,
     dados: DadosAplicacao,
@@ -268,7 +267,7 @@ async def marcar_como_aplicada(
     summary="Deletar registro do histórico",
     description="Remove um registro do histórico vacinal"
 )
-async def deletar_registro(
+def deletar_registro(
     usuario_id: int,
     historico_id: int,
     db: Session = Depends(get_db)
@@ -2,8 +2,10 @@
 from datetime import date
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
 from app.main import app
 from app.database import get_db, SessionLocal, Base, engine
+from app.HistoricoVacina.controller import HistoricoVacinalController
 from app.HistoricoVacina.model import HistoricoVacinal, StatusDose
 from app.Usuario.model import Usuario
 from app.Vacina.model import Vacina
@@ -183,3 +185,66 @@ def test_deletar_historico(test_client, criar_usuario, criar_vacina, db_session)
         f"/usuarios/{criar_usuario.id}/historico/{historico.id}"
     )
     assert response.status_code == 404
+
+# pylint: disable=redefined-outer-name
+def test_marcar_lote_como_aplicado(test_client, criar_usuario, criar_vacina, db_session):
+    """Testa marcar várias doses como aplicadas de uma só vez."""
+    # Cria dois registros de histórico
+    historicos = [
+        HistoricoVacinal(
+            usuario_id=criar_usuario.id,
+            vacina_id=criar_vacina.id,
+            numero_dose=dose,
+            status=StatusDose.PENDENTE
+        )
+        for dose in (1, 2)
+    ]
+    db_session.add_all(historicos)
+    db_session.commit()
+
+    # Dados para marcar como aplicadas
+    dados_aplicacao = {
+        "historico_ids": [h.id for h in historicos],
+        "data_aplicacao": date.today().isoformat(),
+        "lote": "LOTE456"
+    }
+
+    # Faz a requisição
+    response = test_client.patch(
+        f"/usuarios/{criar_usuario.id}/historico/aplicar-lote",
+        json=dados_aplicacao
+    )
+
+    # Verifica a resposta e o estado no banco
+    assert response.status_code == 200
+    assert "2 registro(s)" in response.json()["message"]
+    db_session.expire_all()
+    for h in historicos:
+        assert h.status == StatusDose.APLICADA
+        assert h.lote == "LOTE456"
+
+# pylint: disable=redefined-outer-name
+def test_raiseload_bloqueia_lazy_load_nao_previsto(criar_usuario, criar_vacina, db_session):
+    """Testa que acessar relacionamento não carregado levanta erro em testes."""
+    historico = HistoricoVacinal(
+        usuario_id=criar_usuario.id,
+        vacina_id=criar_vacina.id,
+        numero_dose=1,
+        status=StatusDose.PENDENTE
+    )
+    db_session.add(historico)
+    db_session.commit()
+    db_session.expunge_all()
+
+    atualizado = HistoricoVacinalController.atualizar_registro(
+        db=db_session,
+        historico_id=historico.id,
+        usuario_id=criar_usuario.id,
+        update_data={"lote": "LOTE789"}
+    )
+
+    # A vacina foi carregada via joinedload; o usuário não foi pedido e,
+    # com raiseload("*"), o lazy load vira erro em vez de N+1 silencioso
+    assert atualizado.vacina.id == criar_vacina.id
+    with pytest.raises(InvalidRequestError):
+        _ = atualizado.usuario
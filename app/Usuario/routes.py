@@ -18,7 +18,7 @@ router = APIRouter(prefix="/usuarios", tags=["Usuários"])
     summary="Listar todos os usuários",
     description="Retorna a lista completa de usuários cadastrados no sistema"
 )
-async def listar_usuarios(db: Session = Depends(get_db)):
+def listar_usuarios(db: Session = Depends(get_db)):
     """Lista todos os usuários cadastrados no sistema."""
     usuarios = UsuarioController.listar_todos(db)
     return usuarios
@@ -32,7 +32,7 @@ async def listar_usuarios(db: Session = Depends(get_db)):
     summary="Buscar usuário por ID",
     description="Retorna os dados de um usuário específico"
 )
-async def buscar_usuario(usuario_id: int, db: Session = Depends(get_db)):
+def buscar_usuario(usuario_id: int, db: Session = Depends(get_db)):
     """Busca um usuário pelo ID."""
     usuario = UsuarioController.buscar_por_id(db, usuario_id)
     if not usuario:
@@ -44,7 +44,7 @@ async def buscar_usuario(usuario_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=UsuarioResponse)
-async def criar_usuario(usuario: UsuarioCreate, db: Session = Depends(get_db)):
+def criar_usuario(usuario: UsuarioCreate, db: Session = Depends(get_db)):
     """Cria um novo usuário no sistema."""
     return UsuarioController.criar(db, **usuario.dict())
 
@@ -57,7 +57,7 @@ async def criar_usuario(usuario: UsuarioCreate, db: Session = Depends(get_db)):
     summary="Atualizar usuário",
     description="Atualiza os dados de um usuário existente"
 )
-async def atualizar_usuario(
+def atualizar_usuario(
     usuario_id: int,
     usuario: UsuarioUpdate,
     db: Session = Depends(get_db)
@@ -77,7 +77,7 @@ async def atualizar_usuario(
     summary="Deletar usuário",
     description="Remove um usuário do sistema"
 )
-async def deletar_usuario(usuario_id: int, db: Session = Depends(get_db)):
+def deletar_usuario(usuario_id: int, db: Session = Depends(get_db)):
     """Remove um usuário do sistema."""
     UsuarioController.deletar(db, usuario_id)
     return None
@@ -91,7 +91,7 @@ async def deletar_usuario(usuario_id: int, db: Session = Depends(get_db)):
     summary="Autenticar usuário",
     description="Valida email e senha do usuário"
 )
-async def login(email: str, senha: str, db: Session = Depends(get_db)):
+def login(email: str, senha: str, db: Session = Depends(get_db)):
     """Autentica um usuário."""
     usuario = UsuarioController.autenticar(db, email, senha)
     if not usuario:
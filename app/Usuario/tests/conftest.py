@@ -2,8 +2,10 @@
 """
 import pytest
 from fastapi.testclient import TestClient
+from passlib.context import CryptContext
 from app.main import app
-from app.database import Base, engine, SessionLocal
+from app.database import Base, engine, SessionLocal, get_db
+from app.Usuario.model import Usuario
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -15,9 +17,12 @@ def create_tables():
     Base.metadata.drop_all(bind=engine)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client():
-    """Fornece um cliente de teste para fazer requisições à API.
+    """Fornece um único cliente de teste para toda a sessão.
+
+    O ciclo de startup/shutdown da aplicação roda uma vez só; o isolamento
+    por teste fica a cargo de db_session/override_get_db.
     """
     with TestClient(app) as test_client:
         yield test_client
@@ -25,10 +30,87 @@ def client():
 # pylint: disable=duplicate-code
 @pytest.fixture()
 def db_session():
-    """Fornece uma sessão do banco de dados para cada teste.
+    """Fornece uma sessão envolta em transação + SAVEPOINT para cada teste.
+
+    A transação externa é desfeita no teardown, então as escritas do teste
+    (inclusive commits feitos pelas rotas) somem sem drop_all/create_all.
     """
-    session = SessionLocal()
+    conn = engine.connect()
+    trans = conn.begin()
+    # create_savepoint faz os commits da aplicação liberarem apenas um
+    # SAVEPOINT, mantendo a transação externa aberta até o rollback final
+    session = SessionLocal(bind=conn, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
+        trans.rollback()
+        conn.close()
+
+
+@pytest.fixture()
+def usuario_factory(db_session):
+    """Cria usuários direto pelo ORM, sem HTTP nem hash de senha.
+
+    Com o pwd_context de plaintext dos testes, a senha gravada crua
+    funciona no login; use o endpoint POST apenas quando a própria
+    criação estiver sob teste.
+    """
+    def _criar(nome="Teste", email="teste@teste.com", senha="senha123", is_admin=False):
+        usuario = Usuario(nome=nome, email=email, senha=senha, is_admin=is_admin)
+        db_session.add(usuario)
+        db_session.flush()
+        return usuario
+
+    return _criar
+
+
+@pytest.fixture(scope="session")
+def alice():
+    """Usuário canônico para testes de leitura com controllers mockados.
+
+    Sem sessão anexada, o objeto pode ser compartilhado pela sessão
+    inteira sem risco de estado do ORM.
+    """
+    return Usuario(
+        id=1, nome="Alice", email="alice@test.com", senha="hash", is_admin=False
+    )
+
+
+@pytest.fixture()
+def seed_usuarios(db_session):
+    """Insere vários usuários de uma vez via bulk_save_objects.
+
+    Para cenários que precisam de mais de um usuário pronto, uma única
+    ida ao banco substitui um POST por usuário.
+    """
+    def _seed(usuarios):
+        db_session.bulk_save_objects(usuarios, return_defaults=True)
+        db_session.flush()
+        return usuarios
+
+    return _seed
+
+
+@pytest.fixture(autouse=True)
+def senha_rapida(monkeypatch):
+    """Troca o bcrypt por plaintext nos testes.
+
+    Cada hash bcrypt custa ~100ms de CPU; os testes só precisam que
+    hash/verify sejam consistentes entre si, não que sejam seguros.
+    """
+    monkeypatch.setattr(
+        "app.Usuario.controller.pwd_context",
+        CryptContext(schemes=["plaintext"])
+    )
+
+
+@pytest.fixture(autouse=True)
+def override_get_db(db_session):
+    """Faz as rotas usarem a sessão transacional do teste."""
+    def _get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = _get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
@@ -1,31 +1,49 @@
 """Testes unitários para o modelo de Usuário."""
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.pool import StaticPool
 
 from app.database import Base
 from app.Usuario.model import Usuario
 
 
+@pytest.fixture(scope="session")
+def engine():
+    """Cria o banco em memória e o esquema uma única vez para o módulo."""
+    engine = create_engine("sqlite:///:memory:", poolclass=StaticPool)
+
+    # Mesma receita do engine de teste em app.database: tira do pysqlite o
+    # controle de transação para SAVEPOINT/rollback funcionarem
+    @event.listens_for(engine, "connect")
+    def _sem_autocommit(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture()
+def session(engine):
+    """Sessão por teste dentro de uma transação desfeita no teardown."""
+    connection = engine.connect()
+    trans = connection.begin()
+    session_factory = sessionmaker(bind=connection)
+    db_session = session_factory()
+    yield db_session
+    db_session.close()
+    trans.rollback()
+    connection.close()
+
+
 class TestUsuarioModel:
     """Testes para o modelo de Usuário."""
 
-    @pytest.fixture
-    def engine(self):
-        """Configura um banco de dados SQLite em memória para os testes."""
-        engine = create_engine("sqlite:///:memory:")
-        Base.metadata.create_all(engine)
-        return engine
-
-    @pytest.fixture
-    def session(self, engine):
-        """Fornece uma sessão de banco de dados para cada teste."""
-        session_factory = sessionmaker(bind=engine)
-        db_session = session_factory()
-        yield db_session
-        db_session.close()
-
     def test_criar_usuario(self, session):
         """Deve criar um novo usuário com sucesso."""
         usuario = Usuario(
@@ -57,9 +75,11 @@ class TestUsuarioModel:
 
     def test_email_unico(self, session):
         """Deve garantir que o email seja único no sistema."""
+        # flush basta para o primeiro INSERT; só o segundo precisa do
+        # commit que dispara a violação de UNIQUE
         usuario1 = Usuario(nome="Alice", email="alice@test.com", senha="hash1")
         session.add(usuario1)
-        session.commit()
+        session.flush()
 
         usuario2 = Usuario(nome="Bob", email="alice@test.com", senha="hash2")
         session.add(usuario2)
@@ -72,14 +92,14 @@ class TestUsuarioModel:
         usuario = Usuario(email="test@test.com", senha="hash")
         session.add(usuario)
         with pytest.raises(IntegrityError):
-            session.commit()
+            session.flush()
 
         session.rollback()
 
         usuario = Usuario(nome="Test", senha="hash")
         session.add(usuario)
         with pytest.raises(IntegrityError):
-            session.commit()
+            session.flush()
 
     def test_buscar_usuario_por_id(self, session):
         """Deve buscar um usuário pelo ID com sucesso."""
@@ -1,8 +1,7 @@
 """Testes de rotas para o módulo de usuários."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
-import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
@@ -15,11 +14,8 @@ client = TestClient(app)
 class TestUsuarioView:
     """Testes de rotas para o módulo de usuários."""
     @patch('app.Usuario.routes.UsuarioController.listar_todos')
-    @patch('app.Usuario.routes.get_db')
-    def test_listar_usuarios_vazio(self, mock_get_db, mock_listar):
+    def test_listar_usuarios_vazio(self, mock_listar):
         """Deve retornar lista vazia."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_listar.return_value = []
 
         response = client.get("/usuarios/")
@@ -28,13 +24,10 @@ class TestUsuarioView:
         assert response.json() == []
 
     @patch('app.Usuario.routes.UsuarioController.listar_todos')
-    @patch('app.Usuario.routes.get_db')
-    def test_listar_usuarios_com_dados(self, mock_get_db, mock_listar):
+    def test_listar_usuarios_com_dados(self, mock_listar, alice):
         """Deve retornar lista de usuários."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         usuarios_mock = [
-            Usuario(id=1, nome="Alice", email="alice@test.com", senha="hash1", is_admin=False),
+            alice,
             Usuario(id=2, nome="Bob", email="bob@test.com", senha="hash2", is_admin=False)
         ]
         mock_listar.return_value = usuarios_mock
@@ -48,14 +41,9 @@ class TestUsuarioView:
         assert data[0].get("is_admin") is not None  # Garante que is_admin está presente
 
     @patch('app.Usuario.routes.UsuarioController.buscar_por_id')
-    @patch('app.Usuario.routes.get_db')
-    def test_buscar_usuario_encontrado(self, mock_get_db, mock_buscar):
+    def test_buscar_usuario_encontrado(self, mock_buscar, alice):
         """Deve retornar usuário por ID."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
-        mock_buscar.return_value = Usuario(
-            id=1, nome="Alice", email="alice@test.com", senha="hash", is_admin=False
-        )
+        mock_buscar.return_value = alice
 
         response = client.get("/usuarios/1")
 
@@ -65,11 +53,8 @@ class TestUsuarioView:
         assert data.get("is_admin") is not None  # Garante que is_admin está presente
 
     @patch('app.Usuario.routes.UsuarioController.buscar_por_id')
-    @patch('app.Usuario.routes.get_db')
-    def test_buscar_usuario_nao_encontrado(self, mock_get_db, mock_buscar):
+    def test_buscar_usuario_nao_encontrado(self, mock_buscar):
         """Deve retornar 404 quando usuário não existe."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_buscar.return_value = None
 
         response = client.get("/usuarios/999")
@@ -78,14 +63,9 @@ class TestUsuarioView:
         assert "não encontrado" in response.json()["detail"]
 
     @patch('app.Usuario.routes.UsuarioController.criar')
-    @patch('app.Usuario.routes.get_db')
-    def test_cadastrar_usuario_sucesso(self, mock_get_db, mock_criar):
+    def test_cadastrar_usuario_sucesso(self, mock_criar, alice):
         """Deve cadastrar usuário com sucesso."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
-        mock_criar.return_value = Usuario(
-            id=1, nome="Alice", email="alice@test.com", senha="hash", is_admin=False
-        )
+        mock_criar.return_value = alice
 
         payload = {
             "nome": "Alice",
@@ -102,11 +82,8 @@ class TestUsuarioView:
         assert "senha" not in data
 
     @patch('app.Usuario.routes.UsuarioController.criar')
-    @patch('app.Usuario.routes.get_db')
-    def test_cadastrar_usuario_email_duplicado(self, mock_get_db, mock_criar):
+    def test_cadastrar_usuario_email_duplicado(self, mock_criar):
         """Deve retornar erro ao cadastrar email duplicado."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_criar.side_effect = HTTPException(
             status_code=400,
             detail="Usuário com email 'alice@test.com' já existe"
@@ -142,11 +119,8 @@ class TestUsuarioView:
         assert response.status_code == 422
 
     @patch('app.Usuario.routes.UsuarioController.atualizar')
-    @patch('app.Usuario.routes.get_db')
-    def test_atualizar_usuario_sucesso(self, mock_get_db, mock_atualizar):
+    def test_atualizar_usuario_sucesso(self, mock_atualizar):
         """Deve atualizar usuário com sucesso."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_atualizar.return_value = Usuario(
             id=1, nome="Alice Silva", email="alice@test.com", senha="hash", is_admin=False
         )
@@ -164,11 +138,8 @@ class TestUsuarioView:
         assert data["nome"] == "Alice Silva"
 
     @patch('app.Usuario.routes.UsuarioController.atualizar')
-    @patch('app.Usuario.routes.get_db')
-    def test_atualizar_usuario_nao_encontrado(self, mock_get_db, mock_atualizar):
+    def test_atualizar_usuario_nao_encontrado(self, mock_atualizar):
         """Deve retornar 404 ao atualizar usuário inexistente."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_atualizar.side_effect = HTTPException(
             status_code=404,
             detail="Usuário com ID 999 não encontrado"
@@ -180,11 +151,8 @@ class TestUsuarioView:
         assert response.status_code == 404
 
     @patch('app.Usuario.routes.UsuarioController.deletar')
-    @patch('app.Usuario.routes.get_db')
-    def test_deletar_usuario_sucesso(self, mock_get_db, mock_deletar):
+    def test_deletar_usuario_sucesso(self, mock_deletar):
         """Deve deletar usuário com sucesso."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_deletar.return_value = True
 
         response = client.delete("/usuarios/1")
@@ -193,11 +161,8 @@ class TestUsuarioView:
 
 # pylint: disable=duplicate-code
     @patch('app.Usuario.routes.UsuarioController.deletar')
-    @patch('app.Usuario.routes.get_db')
-    def test_deletar_usuario_nao_encontrado(self, mock_get_db, mock_deletar):
+    def test_deletar_usuario_nao_encontrado(self, mock_deletar):
         """Deve retornar 404 ao deletar usuário inexistente."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_deletar.side_effect = HTTPException(
             status_code=404,
             detail="Usuário com ID 999 não encontrado"
@@ -208,14 +173,9 @@ class TestUsuarioView:
         assert response.status_code == 404
 
     @patch('app.Usuario.routes.UsuarioController.autenticar')
-    @patch('app.Usuario.routes.get_db')
-    def test_login_sucesso(self, mock_get_db, mock_autenticar):
+    def test_login_sucesso(self, mock_autenticar, alice):
         """Deve autenticar usuário com sucesso."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
-        mock_autenticar.return_value = Usuario(
-            id=1, nome="Alice", email="alice@test.com", senha="hash", is_admin=False
-        )
+        mock_autenticar.return_value = alice
 
         response = client.post(
             "/usuarios/login?email=alice@test.com&senha=senha123"
@@ -226,11 +186,8 @@ class TestUsuarioView:
         assert data["email"] == "alice@test.com"
 
     @patch('app.Usuario.routes.UsuarioController.autenticar')
-    @patch('app.Usuario.routes.get_db')
-    def test_login_credenciais_invalidas(self, mock_get_db, mock_autenticar):
+    def test_login_credenciais_invalidas(self, mock_autenticar):
         """Deve retornar 401 com credenciais inválidas."""
-        mock_db = Mock()
-        mock_get_db.return_value = mock_db
         mock_autenticar.return_value = None
 
         response = client.post(
@@ -240,15 +197,7 @@ class TestUsuarioView:
         assert response.status_code == 401
         assert "incorretos" in response.json()["detail"]
 
-# pylint: disable=unused-argument
-    @pytest.mark.parametrize("endpoint,method", [
-        ("/usuarios/", "get"),
-        ("/usuarios/1", "get"),
-        ("/usuarios/", "post"),
-        ("/usuarios/1", "put"),
-        ("/usuarios/1", "delete"),
-    ])
-    def test_endpoints_existen(self, endpoint, method):
+    def test_endpoints_existen(self, route_paths):
         """Verifica se todos os endpoints esperados estão registrados."""
-        routes = [route.path for route in app.routes]
-        assert endpoint in routes or "/usuarios/{usuario_id}" in routes
+        assert "/usuarios/" in route_paths
+        assert "/usuarios/{usuario_id}" in route_paths
@@ -0,0 +1,48 @@
+"""Cache em memória para as leituras de vacinas.
+
+Vacinas são uma tabela de referência quase estática: as rotas GET usam
+cache-aside com TTL e qualquer escrita (POST/PUT/DELETE) limpa o cache
+inteiro, então leituras repetidas nem chegam ao banco.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from app.database import ENV
+
+
+class CacheTTL:
+    """Cache-aside simples, por processo, com expiração por entrada."""
+
+    def __init__(self, ttl_segundos: float = 300.0, ativo: bool = True):
+        self.ttl_segundos = ttl_segundos
+        self.ativo = ativo
+        self._entradas: Dict[str, Tuple[float, Any]] = {}
+
+    def obter(self, chave: str) -> Optional[Any]:
+        """Retorna o valor da chave, ou None se ausente ou expirado."""
+        if not self.ativo:
+            return None
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            return None
+        expira_em, valor = entrada
+        if time.monotonic() >= expira_em:
+            del self._entradas[chave]
+            return None
+        return valor
+
+    def guardar(self, chave: str, valor: Any) -> None:
+        """Armazena o valor com o TTL configurado."""
+        if not self.ativo:
+            return
+        self._entradas[chave] = (time.monotonic() + self.ttl_segundos, valor)
+
+    def limpar(self) -> None:
+        """Descarta todas as entradas (invalidação em escrita)."""
+        self._entradas.clear()
+
+
+# Desligado nos testes: as fixtures limpam o banco por fora das rotas e
+# deixariam o cache apontando para linhas que não existem mais
+cache_vacinas = CacheTTL(ttl_segundos=300.0, ativo=ENV != "test")
@@ -3,8 +3,10 @@
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import insert, update
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.Vacina.model import Vacina
 
@@ -13,9 +15,16 @@ class VacinaValidator:
     """Classe auxiliar para validação de dados de vacina."""
 
     @staticmethod
-    def validar_nome(nome: str) -> bool:
-        """Valida o nome da vacina."""
-        return bool(nome and 0 < len(nome.strip())) <= 100
+    def limpar_nome(nome: Optional[str]) -> Optional[str]:
+        """Normaliza o nome da vacina.
+
+        Retorna o nome sem espaços nas pontas, ou None se ele for vazio
+        ou passar de 100 caracteres.
+        """
+        nome_limpo = (nome or "").strip()
+        if 0 < len(nome_limpo) <= 100:
+            return nome_limpo
+        return None
 
     @staticmethod
     def validar_doses(doses: int) -> bool:
@@ -27,14 +36,26 @@ class VacinaController:
     """Controlador para operações CRUD de vacinas."""
 
     @staticmethod
-    def listar_todas(db: Session) -> List[Vacina]:
-        """Lista todas as vacinas cadastradas."""
-        return db.query(Vacina).all()
+    def listar_todas(db: Session) -> List[Row]:
+        """Lista todas as vacinas cadastradas.
+
+        Consulta só as colunas expostas pela API: as Rows retornadas
+        dispensam o identity map e a hidratação de entidade do ORM, e de
+        quebra nenhuma relação lazy pode ser tocada na listagem.
+        """
+        return db.query(Vacina.id, Vacina.nome, Vacina.doses).all()
 
     @staticmethod
     def buscar_por_id(db: Session, vacina_id: int) -> Optional[Vacina]:
-        """Busca uma vacina pelo ID."""
-        return db.query(Vacina).filter(Vacina.id == vacina_id).first()
+        """Busca uma vacina pelo ID.
+
+        Session.get consulta o identity map antes de ir ao banco, então
+        lookups repetidos na mesma sessão nem emitem SELECT. Como é uma
+        linha só, joinedload resolve o histórico no mesmo round trip.
+        """
+        return db.get(
+            Vacina, vacina_id, options=(joinedload(Vacina.historico_vacinal),)
+        )
 
     @staticmethod
     def buscar_por_nome(db: Session, nome: str) -> Optional[Vacina]:
@@ -44,35 +65,39 @@ class VacinaController:
     @staticmethod
     def criar(db: Session, nome: str, doses: int) -> Vacina:
         """Cria uma nova vacina."""
-        # Validações
-        if not VacinaValidator.validar_nome(nome):
+        # Validações inline no caminho quente; VacinaValidator continua
+        # disponível para quem precisar das regras isoladas
+        nome_limpo = (nome or "").strip()
+        if not 0 < len(nome_limpo) <= 100:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Nome da vacina é obrigatório e deve ter no máximo 100 caracteres"
             )
 
-        if not VacinaValidator.validar_doses(doses):
+        if not 0 < doses <= 10:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Número de doses deve ser entre 1 e 10"
             )
 
-        # Verifica duplicidade
-        if VacinaController.buscar_por_nome(db, nome):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Vacina com nome '{nome}' já existe"
-            )
-
-        # Cria vacina
-        vacina = Vacina(nome=nome.strip(), doses=doses)
+        # A unicidade do nome fica por conta da constraint UNIQUE: inserir
+        # direto e tratar a violação poupa o SELECT de pré-checagem e
+        # elimina a corrida entre checagem e INSERT. RETURNING devolve a
+        # linha gravada no mesmo round trip, dispensando o refresh
+        stmt = insert(Vacina).values(
+            nome=nome_limpo, doses=doses
+        ).returning(Vacina)
         try:
-            db.add(vacina)
+            vacina = db.execute(stmt).scalar_one()
             db.commit()
-            db.refresh(vacina)
             return vacina
         except IntegrityError as e:
             db.rollback()
+            if "unique" in str(e.orig).lower():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Vacina com nome '{nome_limpo}' já existe"
+                ) from e
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Erro ao criar vacina"
@@ -87,49 +112,66 @@ class VacinaController:
         doses: Optional[int] = None
     ) -> Vacina:
         """Atualiza os dados de uma vacina existente."""
-        vacina = VacinaController.buscar_por_id(db, vacina_id)
-        if not vacina:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Vacina com ID {vacina_id} não encontrada"
-            )
+        mudancas = {}
 
         # Valida e atualiza nome
         if nome is not None:
-            if not VacinaValidator.validar_nome(nome):
+            nome_limpo = (nome or "").strip()
+            if not 0 < len(nome_limpo) <= 100:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Nome da vacina inválido"
                 )
-            # Verifica se nome já existe em outra vacina
-            vacina_existente = VacinaController.buscar_por_nome(db, nome)
-            if vacina_existente and vacina_existente.id != vacina_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Já existe outra vacina com o nome '{nome}'"
-                )
-            vacina.nome = nome.strip()
+            # Sem SELECT de pré-checagem: a constraint UNIQUE pega o
+            # conflito no commit, como em criar
+            mudancas["nome"] = nome_limpo
 
         # Valida e atualiza doses
         if doses is not None:
-            if not VacinaValidator.validar_doses(doses):
+            if not 0 < doses <= 10:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Número de doses deve ser entre 1 e 10"
                 )
-            vacina.doses = doses
+            mudancas["doses"] = doses
+
+        if not mudancas:
+            vacina = VacinaController.buscar_por_id(db, vacina_id)
+            if not vacina:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Vacina com ID {vacina_id} não encontrada"
+                )
+            return vacina
 
+        # UPDATE .. RETURNING em um único round trip: a própria resposta
+        # diz se a linha existia, dispensando SELECT prévio e refresh
+        stmt = update(Vacina).where(
+            Vacina.id == vacina_id
+        ).values(**mudancas).returning(Vacina)
         try:
+            vacina = db.execute(stmt).scalar_one_or_none()
             db.commit()
-            db.refresh(vacina)
-            return vacina
         except IntegrityError as e:
             db.rollback()
+            if "unique" in str(e.orig).lower():
+                nome_tentado = mudancas.get("nome")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Já existe outra vacina com o nome '{nome_tentado}'"
+                ) from e
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Erro ao atualizar vacina"
             ) from e
 
+        if vacina is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Vacina com ID {vacina_id} não encontrada"
+            )
+        return vacina
+
     @staticmethod
     def deletar(db: Session, vacina_id: int) -> bool:
         """Remove uma vacina do sistema."""
@@ -1,6 +1,6 @@
 """Modelo de dados para representar as vacinas no sistema."""
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -14,16 +14,26 @@ class Vacina(Base):
     nome = Column(String(100), unique=True, nullable=False, index=True)
     doses = Column(Integer, nullable=False)
 
+    # Índice composto cobrindo buscar_por_doses: o filtro usa o prefixo
+    # (doses) e o nome já sai do próprio índice, sem voltar à tabela
+    __table_args__ = (
+        Index("ix_vacinas_doses_nome", "doses", "nome"),
+    )
+
     historico_vacinal = relationship("HistoricoVacinal", back_populates="vacina")
 
+    # Chaves pré-internadas de to_dict: evita recriar o literal (e
+    # recalcular os hashes) a cada linha serializada
+    _KEYS = ("id", "nome", "doses")
+
     def __repr__(self) -> str:
         """Retorna uma representação em string do objeto Vacina."""
-        return f"<Vacina(id={self.id}, nome='{self.nome}', doses={self.doses})>"
+        # %-formatting usa o caminho rápido em C do CPython; repr roda a
+        # cada log de debug do SQLAlchemy e diff de assert do pytest
+        return "<Vacina(id=%s, nome='%s', doses=%s)>" % (
+            self.id, self.nome, self.doses
+        )
 
     def to_dict(self) -> dict:
         """Converte o objeto Vacina para um dicionário."""
-        return {
-            "id": self.id,
-            "nome": self.nome,
-            "doses": self.doses
-        }
+        return dict(zip(self._KEYS, (self.id, self.nome, self.doses)))
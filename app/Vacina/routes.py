@@ -3,25 +3,49 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.schemas import VacinaCreate, VacinaResponse, VacinaUpdate, ErrorResponse
+from app.Vacina.cache import cache_vacinas
 from app.Vacina.controller import VacinaController
 
 router = APIRouter(prefix="/vacinas", tags=["Vacinas"])
 
+# Construído uma vez na importação: valida e despeja a lista inteira em
+# uma passada no core do Pydantic, sem loop Python por elemento
+_VACINA_LIST_ADAPTER = TypeAdapter(List[VacinaResponse])
+
 @router.get(
     "/",
-    response_model=List[VacinaResponse],
     status_code=status.HTTP_200_OK,
+    # Sem response_model (a rota devolve a Response pronta); o schema da
+    # documentação continua declarado aqui
+    responses={200: {"model": List[VacinaResponse]}},
     summary="Listar todas as vacinas",
     description="Retorna a lista completa de vacinas cadastradas no sistema"
 )
-async def listar_vacinas(db: Session = Depends(get_db)) -> List[VacinaResponse]:
-    """Lista todas as vacinas cadastradas no sistema."""
+# Handlers síncronos: o SQLAlchemy aqui é bloqueante, e em "def" o
+# Starlette despacha para o threadpool em vez de travar o event loop
+def listar_vacinas(db: Session = Depends(get_db)) -> ORJSONResponse:
+    """Lista todas as vacinas cadastradas no sistema.
+
+    O TypeAdapter serializa a lista inteira de uma vez e a ORJSONResponse
+    é devolvida direto, pulando o jsonable_encoder por elemento que o
+    response_model aplicaria.
+    """
+    em_cache = cache_vacinas.obter("listar")
+    if em_cache is not None:
+        return ORJSONResponse(em_cache)
     vacinas = VacinaController.listar_todas(db)
-    return vacinas
+    resposta = _VACINA_LIST_ADAPTER.dump_python(
+        _VACINA_LIST_ADAPTER.validate_python(vacinas, from_attributes=True),
+        mode="json",
+    )
+    cache_vacinas.guardar("listar", resposta)
+    return ORJSONResponse(resposta)
 
 @router.get(
     "/{vacina_id}",
@@ -31,18 +55,24 @@ async def listar_vacinas(db: Session = Depends(get_db)) -> List[VacinaResponse]:
     summary="Buscar vacina por ID",
     description="Retorna os dados de uma vacina específica"
 )
-async def buscar_vacina(
+def buscar_vacina(
     vacina_id: int,
     db: Session = Depends(get_db)
 ) -> VacinaResponse:
     """Busca uma vacina pelo seu ID."""
+    em_cache = cache_vacinas.obter(f"vacina:{vacina_id}")
+    if em_cache is not None:
+        return em_cache
     vacina = VacinaController.buscar_por_id(db, vacina_id)
     if not vacina:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vacina com ID {vacina_id} não encontrada"
         )
-    return VacinaResponse.from_orm(vacina)
+    # Sem from_orm explícito: o response_model já valida na saída, e
+    # validar aqui de novo seria construir o modelo duas vezes
+    cache_vacinas.guardar(f"vacina:{vacina_id}", vacina)
+    return vacina
 
 @router.post(
     "/",
@@ -52,12 +82,13 @@ async def buscar_vacina(
     summary="Cadastrar nova vacina",
     description="Cria uma nova vacina no sistema"
 )
-async def cadastrar_vacina(
+def cadastrar_vacina(
     vacina: VacinaCreate,
     db: Session = Depends(get_db)
 ) -> VacinaResponse:
     """Cadastra uma nova vacina no sistema."""
     nova_vacina = VacinaController.criar(db, vacina.nome, vacina.doses)
+    cache_vacinas.limpar()
     return nova_vacina
 
 @router.put(
@@ -71,7 +102,7 @@ async def cadastrar_vacina(
     summary="Atualizar vacina",
     description="Atualiza os dados de uma vacina existente"
 )
-async def atualizar_vacina(
+def atualizar_vacina(
     vacina_id: int,
     vacina: VacinaUpdate,
     db: Session = Depends(get_db)
@@ -80,6 +111,7 @@ async def atualizar_vacina(
     vacina_atualizada = VacinaController.atualizar(
         db, vacina_id, vacina.nome, vacina.doses
     )
+    cache_vacinas.limpar()
     return vacina_atualizada
 
 @router.delete(
@@ -89,10 +121,11 @@ async def atualizar_vacina(
     summary="Deletar vacina",
     description="Remove uma vacina do sistema"
 )
-async def deletar_vacina(
+def deletar_vacina(
     vacina_id: int,
     db: Session = Depends(get_db)
 ) -> None:
     """Remove uma vacina do sistema."""
     VacinaController.deletar(db, vacina_id)
+    cache_vacinas.limpar()
     return None
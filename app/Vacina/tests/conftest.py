@@ -0,0 +1,77 @@
+"""Configuração de fixtures para os testes do módulo de Vacina."""
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.database import Base, engine, SessionLocal, get_db
+from app.Vacina.model import Vacina
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    """Cria o esquema uma única vez para todos os testes do módulo."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest_asyncio.fixture()
+async def async_client():
+    """Cliente assíncrono falando ASGI direto com a aplicação.
+
+    Diferente do TestClient, não cria uma thread por requisição: cada
+    chamada é um await no próprio loop do teste.
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+# pylint: disable=duplicate-code
+@pytest.fixture()
+def db_session():
+    """Fornece uma sessão envolta em transação + SAVEPOINT para cada teste.
+
+    A transação externa é desfeita no teardown, então as escritas do teste
+    (inclusive commits feitos pelas rotas) somem sem DELETE por tabela nem
+    drop_all/create_all.
+    """
+    conn = engine.connect()
+    trans = conn.begin()
+    # create_savepoint faz os commits da aplicação liberarem apenas um
+    # SAVEPOINT, mantendo a transação externa aberta até o rollback final
+    session = SessionLocal(bind=conn, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        trans.rollback()
+        conn.close()
+
+
+@pytest.fixture()
+def seed_vacinas(db_session):
+    """Insere vacinas direto pelo ORM, em um único INSERT.
+
+    Cada client.post de preparação custa um ciclo HTTP + commit; para
+    montar cenário, bulk_insert_mappings faz tudo numa ida só. O caminho
+    de POST continua coberto pelos testes de criação e pelo fluxo CRUD
+    completo.
+    """
+    def _seed(vacinas):
+        db_session.bulk_insert_mappings(Vacina, vacinas, return_defaults=True)
+        db_session.flush()
+        return vacinas
+
+    return _seed
+
+
+@pytest.fixture(autouse=True)
+def override_get_db(db_session):
+    """Faz as rotas usarem a sessão transacional do teste."""
+    def _get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = _get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
@@ -0,0 +1,45 @@
+"""Testes unitários para o cache de leituras de vacinas."""
+
+from app.Vacina.cache import CacheTTL
+
+
+class TestCacheTTL:
+    """Testes do cache-aside com TTL."""
+
+    def test_guardar_e_obter(self):
+        """Deve retornar o valor guardado dentro do TTL."""
+        cache = CacheTTL(ttl_segundos=60)
+        cache.guardar("listar", [1, 2, 3])
+
+        assert cache.obter("listar") == [1, 2, 3]
+
+    def test_chave_ausente(self):
+        """Deve retornar None para chave nunca guardada."""
+        cache = CacheTTL(ttl_segundos=60)
+
+        assert cache.obter("listar") is None
+
+    def test_entrada_expirada(self):
+        """Deve descartar entradas cujo TTL já passou."""
+        cache = CacheTTL(ttl_segundos=0)
+        cache.guardar("listar", [1])
+
+        assert cache.obter("listar") is None
+
+    def test_limpar_invalida_tudo(self):
+        """Escritas limpam o cache inteiro."""
+        cache = CacheTTL(ttl_segundos=60)
+        cache.guardar("listar", [1])
+        cache.guardar("vacina:1", {"id": 1})
+
+        cache.limpar()
+
+        assert cache.obter("listar") is None
+        assert cache.obter("vacina:1") is None
+
+    def test_inativo_nao_guarda(self):
+        """Com ativo=False (modo de teste), o cache vira no-op."""
+        cache = CacheTTL(ttl_segundos=60, ativo=False)
+        cache.guardar("listar", [1])
+
+        assert cache.obter("listar") is None
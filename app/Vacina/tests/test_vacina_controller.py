@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 
 from app.Vacina.controller import VacinaController
 from app.Vacina.model import Vacina
@@ -41,7 +42,7 @@ class TestVacinaController:
         """Deve retornar vacina quando ID existe."""
         db_mock = Mock()
         vacina_mock = Vacina(id=1, nome="BCG", doses=1)
-        db_mock.query.return_value.filter.return_value.first.return_value = vacina_mock
+        db_mock.get.return_value = vacina_mock
 
         resultado = VacinaController.buscar_por_id(db_mock, 1)
 
@@ -51,7 +52,7 @@ class TestVacinaController:
     def test_buscar_por_id_nao_encontrada(self):
         """Deve retornar None quando ID não existe."""
         db_mock = Mock()
-        db_mock.query.return_value.filter.return_value.first.return_value = None
+        db_mock.get.return_value = None
 
         resultado = VacinaController.buscar_por_id(db_mock, 999)
 
@@ -71,26 +72,31 @@ class TestVacinaController:
     def test_criar_vacina_sucesso(self):
         """Deve criar vacina com sucesso."""
         db_mock = Mock()
-        db_mock.query.return_value.filter.return_value.first.return_value = None
+        db_mock.execute.return_value.scalar_one.return_value = Vacina(
+            id=1, nome="COVID-19", doses=2
+        )
 
         resultado = VacinaController.criar(db_mock, "COVID-19", 2)
 
         assert resultado.nome == "COVID-19"
         assert resultado.doses == 2
-        db_mock.add.assert_called_once()
+        db_mock.execute.assert_called_once()
         db_mock.commit.assert_called_once()
 
     def test_criar_vacina_duplicada(self):
         """Deve lançar exceção ao criar vacina com nome duplicado."""
         db_mock = Mock()
-        vacina_existente = Vacina(id=1, nome="BCG", doses=1)
-        db_mock.query.return_value.filter.return_value.first.return_value = vacina_existente
+        db_mock.execute.side_effect = IntegrityError(
+            "INSERT INTO vacinas", {},
+            Exception("UNIQUE constraint failed: vacinas.nome")
+        )
 
         with pytest.raises(HTTPException) as exc_info:
             VacinaController.criar(db_mock, "BCG", 1)
 
         assert exc_info.value.status_code == 400
         assert "já existe" in exc_info.value.detail
+        db_mock.rollback.assert_called_once()
 
     def test_criar_vacina_nome_vazio(self):
         """Deve lançar exceção ao criar vacina com nome vazio."""
@@ -101,11 +107,20 @@ class TestVacinaController:
 
         assert exc_info.value.status_code == 400
 
+    def test_criar_vacina_nome_muito_longo(self):
+        """Deve lançar exceção ao criar vacina com nome acima de 100 caracteres."""
+        db_mock = Mock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            VacinaController.criar(db_mock, "V" * 101, 1)
+
+        assert exc_info.value.status_code == 400
+
     def test_atualizar_vacina_sucesso(self):
         """Deve atualizar vacina com sucesso."""
         db_mock = Mock()
-        vacina_mock = Vacina(id=1, nome="BCG", doses=1)
-        db_mock.query.return_value.filter.return_value.first.return_value = vacina_mock
+        vacina_mock = Vacina(id=1, nome="BCG Atualizada", doses=2)
+        db_mock.execute.return_value.scalar_one_or_none.return_value = vacina_mock
 
         resultado = VacinaController.atualizar(
             db_mock, 1, nome="BCG Atualizada", doses=2
@@ -117,7 +132,7 @@ class TestVacinaController:
     def test_atualizar_vacina_nao_encontrada(self):
         """Deve lançar exceção ao atualizar vacina inexistente."""
         db_mock = Mock()
-        db_mock.query.return_value.filter.return_value.first.return_value = None
+        db_mock.execute.return_value.scalar_one_or_none.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
             VacinaController.atualizar(db_mock, 999, nome="Teste")
@@ -128,7 +143,7 @@ class TestVacinaController:
         """Deve deletar vacina com sucesso."""
         db_mock = Mock()
         vacina_mock = Vacina(id=1, nome="BCG", doses=1)
-        db_mock.query.return_value.filter.return_value.first.return_value = vacina_mock
+        db_mock.get.return_value = vacina_mock
 
         resultado = VacinaController.deletar(db_mock, 1)
 
@@ -138,7 +153,7 @@ class TestVacinaController:
     def test_deletar_vacina_nao_encontrada(self):
         """Deve lançar exceção ao deletar vacina inexistente."""
         db_mock = Mock()
-        db_mock.query.return_value.filter.return_value.first.return_value = None
+        db_mock.get.return_value = None
 
         with pytest.raises(HTTPException) as exc_info:
             VacinaController.deletar(db_mock, 999)
@@ -172,7 +187,9 @@ class TestVacinaController:
         """Testa criação com múltiplos casos."""
         db_mock = Mock()
         if valido:
-            db_mock.query.return_value.filter.return_value.first.return_value = None
+            db_mock.execute.return_value.scalar_one.return_value = Vacina(
+                id=1, nome=nome.strip(), doses=doses
+            )
             resultado = VacinaController.criar(db_mock, nome, doses)
             assert resultado.nome == nome or resultado.nome == nome.strip()
         else:
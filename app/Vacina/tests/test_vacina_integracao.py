@@ -1,41 +1,30 @@
 """Testes de integração para o módulo de Vacinas."""
 
 import pytest
-from fastapi.testclient import TestClient
+from sqlalchemy import event
 
-from app.main import app
-from app.database import Base, engine
+from app.database import engine
 
-# Cria um cliente de teste para a aplicação
-client = TestClient(app)
-
-
-@pytest.fixture(scope="function", autouse=True)
-def setup_database():
-    """Configura o banco de dados para cada teste."""
-    # Limpa e recria todas as tabelas do banco de dados
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    yield
-    # Limpa as tabelas após o teste
-    Base.metadata.drop_all(bind=engine)
+# Todos os testes do módulo rodam no event loop do pytest-asyncio;
+# async_client, seed_vacinas e o isolamento transacional vêm do conftest
+pytestmark = pytest.mark.asyncio
 
 
 # pylint: disable=too-many-public-methods
 class TestVacinaIntegration:
     """Testes de integração para o módulo de Vacinas."""
 
-    def test_listar_vacinas_vazio(self):
+    async def test_listar_vacinas_vazio(self, async_client):
         """Deve retornar uma lista vazia quando não há vacinas cadastradas."""
         # Executa a requisição
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
 
         # Verifica a resposta
         assert response.status_code == 200
         assert isinstance(response.json(), list)
         assert len(response.json()) == 0
 
-    def test_adicionar_vacina_sucesso(self):
+    async def test_adicionar_vacina_sucesso(self, async_client):
         """Deve adicionar uma nova vacina com sucesso."""
         # Dados da nova vacina
         nova_vacina = {
@@ -44,7 +33,7 @@ class TestVacinaIntegration:
         }
 
         # Executa a requisição
-        response = client.post("/vacinas/", json=nova_vacina)
+        response = await async_client.post("/vacinas/", json=nova_vacina)
 
         # Verifica a resposta
         assert response.status_code == 201
@@ -54,13 +43,15 @@ class TestVacinaIntegration:
         assert "id" in body
         assert body["id"] > 0
 
-    def test_listar_vacinas_com_dados(self):
+    async def test_listar_vacinas_com_dados(self, async_client, seed_vacinas):
         """Deve listar corretamente múltiplas vacinas cadastradas."""
-        client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
-        client.post("/vacinas/", json={"nome": "Hepatite B", "doses": 3})
-        client.post("/vacinas/", json={"nome": "COVID-19", "doses": 2})
+        seed_vacinas([
+            {"nome": "BCG", "doses": 1},
+            {"nome": "Hepatite B", "doses": 3},
+            {"nome": "COVID-19", "doses": 2},
+        ])
 
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
         assert response.status_code == 200
 
         vacinas = response.json()
@@ -68,12 +59,12 @@ class TestVacinaIntegration:
         assert any(v["nome"] == "BCG" for v in vacinas)
         assert any(v["nome"] == "Hepatite B" for v in vacinas)
 
-    def test_buscar_vacina_por_id_sucesso(self):
+    async def test_buscar_vacina_por_id_sucesso(self, async_client):
         """Deve retornar os detalhes de uma vacina específica pelo ID."""
-        response_create = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response_create = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         vacina_id = response_create.json()["id"]
 
-        response = client.get(f"/vacinas/{vacina_id}")
+        response = await async_client.get(f"/vacinas/{vacina_id}")
         assert response.status_code == 200
 
         vacina = response.json()
@@ -81,43 +72,43 @@ class TestVacinaIntegration:
         assert vacina["nome"] == "BCG"
         assert vacina["doses"] == 1
 
-    def test_buscar_vacina_nao_encontrada(self):
+    async def test_buscar_vacina_nao_encontrada(self, async_client):
         """Deve retornar erro 404 ao buscar uma vacina com ID inexistente."""
-        response = client.get("/vacinas/99999")
+        response = await async_client.get("/vacinas/99999")
         assert response.status_code == 404
         assert "não encontrada" in response.json()["detail"].lower()
 
-    def test_adicionar_vacina_nome_duplicado(self):
+    async def test_adicionar_vacina_nome_duplicado(self, async_client, seed_vacinas):
         """Deve impedir o cadastro de vacina com nome duplicado."""
-        client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        seed_vacinas([{"nome": "BCG", "doses": 1}])
 
-        response = client.post("/vacinas/", json={"nome": "BCG", "doses": 2})
+        response = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 2})
         assert response.status_code == 400
         assert "já existe" in response.json()["detail"].lower()
 
-    def test_adicionar_vacina_dados_invalidos(self):
+    async def test_adicionar_vacina_dados_invalidos(self, async_client):
         """Deve validar os dados fornecidos ao cadastrar uma vacina."""
-        response = client.post("/vacinas/", json={"nome": "", "doses": 1})
+        response = await async_client.post("/vacinas/", json={"nome": "", "doses": 1})
         assert response.status_code == 422
 
-        response = client.post("/vacinas/", json={"nome": "Teste", "doses": 0})
+        response = await async_client.post("/vacinas/", json={"nome": "Teste", "doses": 0})
         assert response.status_code == 422
 
-        response = client.post("/vacinas/", json={"nome": "Teste", "doses": -1})
+        response = await async_client.post("/vacinas/", json={"nome": "Teste", "doses": -1})
         assert response.status_code == 422
 
-        response = client.post("/vacinas/", json={"nome": "Teste", "doses": 11})
+        response = await async_client.post("/vacinas/", json={"nome": "Teste", "doses": 11})
         assert response.status_code == 422
 
-        response = client.post("/vacinas/", json={"nome": "Teste"})
+        response = await async_client.post("/vacinas/", json={"nome": "Teste"})
         assert response.status_code == 422
 
-    def test_atualizar_vacina_sucesso(self):
+    async def test_atualizar_vacina_sucesso(self, async_client):
         """Deve atualizar corretamente os dados de uma vacina existente."""
-        response_create = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response_create = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         vacina_id = response_create.json()["id"]
 
-        response = client.put(
+        response = await async_client.put(
             f"/vacinas/{vacina_id}",
             json={"nome": "BCG Atualizada", "doses": 2}
         )
@@ -127,57 +118,57 @@ class TestVacinaIntegration:
         assert vacina["nome"] == "BCG Atualizada"
         assert vacina["doses"] == 2
 
-    def test_atualizar_vacina_nao_encontrada(self):
+    async def test_atualizar_vacina_nao_encontrada(self, async_client):
         """Deve retornar erro 404 ao tentar atualizar vacina inexistente."""
-        response = client.put(
+        response = await async_client.put(
             "/vacinas/99999",
             json={"nome": "Teste", "doses": 1}
         )
         assert response.status_code == 404
 
-    def test_deletar_vacina_sucesso(self):
+    async def test_deletar_vacina_sucesso(self, async_client):
         """Deve remover uma vacina existente com sucesso."""
-        response_create = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response_create = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         vacina_id = response_create.json()["id"]
 
-        response = client.delete(f"/vacinas/{vacina_id}")
+        response = await async_client.delete(f"/vacinas/{vacina_id}")
         assert response.status_code == 204
 
-        response_get = client.get(f"/vacinas/{vacina_id}")
+        response_get = await async_client.get(f"/vacinas/{vacina_id}")
         assert response_get.status_code == 404
 
-    def test_deletar_vacina_nao_encontrada(self):
+    async def test_deletar_vacina_nao_encontrada(self, async_client):
         """Deve retornar erro 404 ao tentar remover vacina inexistente."""
-        response = client.delete("/vacinas/99999")
+        response = await async_client.delete("/vacinas/99999")
         assert response.status_code == 404
 
-    def test_fluxo_completo_crud(self):
+    async def test_fluxo_completo_crud(self, async_client):
         """Deve executar com sucesso todas as operações CRUD em sequência."""
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
         assert len(response.json()) == 0
 
-        response = client.post("/vacinas/", json={"nome": "COVID-19", "doses": 2})
+        response = await async_client.post("/vacinas/", json={"nome": "COVID-19", "doses": 2})
         assert response.status_code == 201
         vacina_id = response.json()["id"]
 
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
         assert len(response.json()) == 1
 
-        response = client.get(f"/vacinas/{vacina_id}")
+        response = await async_client.get(f"/vacinas/{vacina_id}")
         assert response.status_code == 200
         assert response.json()["nome"] == "COVID-19"
 
-        response = client.put(
+        response = await async_client.put(
             f"/vacinas/{vacina_id}",
             json={"nome": "COVID-19 Pfizer", "doses": 3}
         )
         assert response.status_code == 200
         assert response.json()["doses"] == 3
 
-        response = client.delete(f"/vacinas/{vacina_id}")
+        response = await async_client.delete(f"/vacinas/{vacina_id}")
         assert response.status_code == 204
 
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
         assert len(response.json()) == 0
 
     @pytest.mark.parametrize("nome,doses,esperado", [
@@ -186,32 +177,31 @@ class TestVacinaIntegration:
         ("Tríplice Viral", 2, 201),
         ("Febre Amarela", 1, 201),
     ])
-    def test_adicionar_vacinas_validas(self, nome, doses, esperado):
+    async def test_adicionar_vacinas_validas(self, async_client, nome, doses, esperado):
         """Deve aceitar diferentes combinações válidas de nome e doses."""
-        response = client.post("/vacinas/", json={"nome": nome, "doses": doses})
+        response = await async_client.post("/vacinas/", json={"nome": nome, "doses": doses})
         assert response.status_code == esperado
         assert response.json()["nome"] == nome
         assert response.json()["doses"] == doses
 
-    def test_atualizar_vacina_nome_duplicado(self):
+    async def test_atualizar_vacina_nome_duplicado(self, async_client, seed_vacinas):
         """Deve impedir a atualização para um nome de vacina já existente."""
-        client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
-        response_create = client.post(
-            "/vacinas/",
-            json={"nome": "Hepatite B", "doses": 3}
-        )
-        vacina_id = response_create.json()["id"]
+        vacinas = seed_vacinas([
+            {"nome": "BCG", "doses": 1},
+            {"nome": "Hepatite B", "doses": 3},
+        ])
+        vacina_id = vacinas[1]["id"]
 
-        response = client.put(
+        response = await async_client.put(
             f"/vacinas/{vacina_id}",
             json={"nome": "BCG"}
         )
         assert response.status_code == 400
         assert "já existe" in response.json()["detail"].lower()
 
-    def test_response_structure(self):
+    async def test_response_structure(self, async_client):
         """Deve retornar a estrutura de dados correta na resposta."""
-        response = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         data = response.json()
 
         assert "id" in data
@@ -221,22 +211,24 @@ class TestVacinaIntegration:
         assert isinstance(data["nome"], str)
         assert isinstance(data["doses"], int)
 
-    def test_multiplas_vacinas_mesma_dose(self):
+    async def test_multiplas_vacinas_mesma_dose(self, async_client, seed_vacinas):
         """Deve permitir o cadastro de múltiplas vacinas com mesmo número de doses."""
-        client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
-        client.post("/vacinas/", json={"nome": "Febre Amarela", "doses": 1})
+        seed_vacinas([
+            {"nome": "BCG", "doses": 1},
+            {"nome": "Febre Amarela", "doses": 1},
+        ])
 
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
         vacinas = response.json()
         vacinas_dose_1 = [v for v in vacinas if v["doses"] == 1]
         assert len(vacinas_dose_1) == 2
 
-    def test_atualizar_apenas_nome(self):
+    async def test_atualizar_apenas_nome(self, async_client):
         """Deve atualizar apenas o nome mantendo os outros campos sem alterar."""
-        response_create = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response_create = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         vacina_id = response_create.json()["id"]
 
-        response = client.put(
+        response = await async_client.put(
             f"/vacinas/{vacina_id}",
             json={"nome": "BCG Atualizada"}
         )
@@ -244,12 +236,12 @@ class TestVacinaIntegration:
         assert response.json()["nome"] == "BCG Atualizada"
         assert response.json()["doses"] == 1
 
-    def test_atualizar_apenas_doses(self):
+    async def test_atualizar_apenas_doses(self, async_client):
         """Deve atualizar apenas o número de doses mantendo o nome."""
-        response_create = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response_create = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         vacina_id = response_create.json()["id"]
 
-        response = client.put(
+        response = await async_client.put(
             f"/vacinas/{vacina_id}",
             json={"doses": 3}
         )
@@ -257,33 +249,60 @@ class TestVacinaIntegration:
         assert response.json()["nome"] == "BCG"
         assert response.json()["doses"] == 3
 
-    def test_criar_e_buscar_imediatamente(self):
+    async def test_criar_e_buscar_imediatamente(self, async_client):
         """Deve ser possível buscar uma vacina imediatamente após criá-la."""
-        response_create = client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
+        response_create = await async_client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
         vacina_id = response_create.json()["id"]
 
-        response_get = client.get(f"/vacinas/{vacina_id}")
+        response_get = await async_client.get(f"/vacinas/{vacina_id}")
         assert response_get.status_code == 200
         assert response_get.json()["id"] == vacina_id
         assert response_get.json()["nome"] == "BCG"
 
-    def test_deletar_e_verificar_lista(self):
+    async def test_deletar_e_verificar_lista(self, async_client, seed_vacinas):
         """Deve remover a vacina da lista após exclusão."""
-        client.post("/vacinas/", json={"nome": "BCG", "doses": 1})
-        response2 = client.post("/vacinas/", json={"nome": "Hepatite B", "doses": 3})
-        vacina_id = response2.json()["id"]
+        vacinas = seed_vacinas([
+            {"nome": "BCG", "doses": 1},
+            {"nome": "Hepatite B", "doses": 3},
+        ])
+        vacina_id = vacinas[1]["id"]
 
-        client.delete(f"/vacinas/{vacina_id}")
+        await async_client.delete(f"/vacinas/{vacina_id}")
 
-        response = client.get("/vacinas/")
+        response = await async_client.get("/vacinas/")
         vacinas = response.json()
         assert len(vacinas) == 1
         assert vacinas[0]["nome"] == "BCG"
 
+    async def test_listar_sem_n_mais_um(self, async_client, seed_vacinas):
+        """A listagem deve emitir um número constante de consultas.
+
+        Sem eager loading, tocar o histórico de cada vacina dispararia um
+        SELECT por linha; aqui o total não pode crescer com o volume.
+        """
+        seed_vacinas([{"nome": f"Vacina {i}", "doses": 1} for i in range(5)])
+
+        consultas = []
+
+        def contar(_conn, _cursor, statement, *_args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                consultas.append(statement)
+
+        event.listen(engine, "before_cursor_execute", contar)
+        try:
+            response = await async_client.get("/vacinas/")
+        finally:
+            event.remove(engine, "before_cursor_execute", contar)
+
+        assert response.status_code == 200
+        assert len(response.json()) == 5
+        # 1 SELECT das vacinas + no máximo 1 do selectinload dos históricos
+        assert len(consultas) <= 2
+
     @pytest.mark.parametrize("doses_invalidas", [0, -1, -5, 11, 20, 100])
-    def test_doses_invalidas_parametrizado(self, doses_invalidas):
+    async def test_doses_invalidas_parametrizado(self, async_client, doses_invalidas):
         """Deve rejeitar valores inválidos para o número de doses."""
-        response = client.post(
+        response = await async_client.post(
             "/vacinas/",
             json={"nome": "Teste", "doses": doses_invalidas}
         )
@@ -32,6 +32,15 @@ class TestVacinaModel:
         assert "COVID-19" in repr_str
         assert "2" in repr_str
 
+    def test_nome_unico_na_tabela(self):
+        """A coluna nome deve manter a constraint UNIQUE.
+
+        VacinaController.criar insere direto e trata IntegrityError em
+        vez de pré-checar duplicidade; sem esta constraint o tratamento
+        de duplicata deixaria de funcionar silenciosamente.
+        """
+        assert Vacina.__table__.columns["nome"].unique is True
+
     @pytest.mark.parametrize("nome,doses", [
         ("Tétano", 3),
         ("Raiva", 5),
@@ -220,15 +220,7 @@ class TestVacinaRoutes:
         # Verifica a resposta
         assert response.status_code == 404
 
- # pylint: disable=unused-argument
-    @pytest.mark.parametrize("endpoint,method", [
-        ("/vacinas/", "get"),
-        ("/vacinas/1", "get"),
-        ("/vacinas/", "post"),
-        ("/vacinas/1", "put"),
-        ("/vacinas/1", "delete"),
-    ])
-    def test_endpoints_existem(self, endpoint, method):
+    def test_endpoints_existem(self, route_paths):
         """Verifica se todos os endpoints esperados estão registrados nas rotas da aplicação."""
-        routes = [route.path for route in app.routes]
-        assert endpoint in routes or "/vacinas/{vacina_id}" in routes
+        assert "/vacinas/" in route_paths
+        assert "/vacinas/{vacina_id}" in route_paths
@@ -1,12 +1,17 @@
 """Módulo de configuração do banco de dados."""
 import os
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 ENV = os.getenv("ENV", "dev")
 
 if ENV == "test":
-    DATABASE_URL = "sqlite:///./test_imunetrack.db"
+    # SQLite em memória: nenhum fsync por commit; cada worker do
+    # pytest-xdist é um processo próprio, então o isolamento entre
+    # workers vem de graça
+    DATABASE_URL = "sqlite:///:memory:"
 else:
     DATABASE_URL = os.getenv(
         "DATABASE_URL",
@@ -16,17 +21,51 @@ else:
 
 # Configuração do engine com suporte para SQLite em testes
 connect_args = {"check_same_thread": False} if ENV == "test" else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+if ENV == "test":
+    # StaticPool mantém uma única conexão compartilhada, para todas as
+    # sessões enxergarem o mesmo banco em memória
+    engine = create_engine(
+        DATABASE_URL, connect_args=connect_args, poolclass=StaticPool
+    )
+
+    # O driver pysqlite intercepta o controle de transação e quebra o uso
+    # de SAVEPOINT; a receita da documentação do SQLAlchemy desativa esse
+    # controle e emite o BEGIN manualmente, permitindo fixtures de teste
+    # transacionais (rollback por teste)
+    @event.listens_for(engine, "connect")
+    def _sqlite_sem_autocommit(dbapi_connection, _connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _sqlite_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+else:
+    # Pool limitado e com pre-ping para evitar conexões mortas sob carga;
+    # LIFO reutiliza sempre as mesmas conexões quentes e deixa o resto
+    # expirar via pool_recycle
+    engine = create_engine(
+        DATABASE_URL,
+        pool_size=20,
+        max_overflow=20,
+        pool_timeout=30,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        pool_use_lifo=True,
+    )
 
 # pylint: disable=invalid-name
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False evita o SELECT de recarga após cada commit
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 Base = declarative_base()
 
 
-def get_db():
-    """Gerenciador de contexto para sessões do banco de dados."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+def get_db(request: Request):
+    """Retorna a sessão da requisição aberta pelo DBSessionMiddleware.
+
+    A sessão é criada (e fechada) uma vez por requisição no middleware;
+    a dependência vira um getattr, sem setup/teardown de gerador por
+    rota. Os testes continuam trocando via app.dependency_overrides.
+    """
+    return request.state.db
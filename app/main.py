@@ -1,31 +1,42 @@
 """Módulo principal da aplicação ImuneTrack."""
+import logging
 import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import OperationalError
-from app.database import Base, engine
+from app.database import Base, engine, ENV, SessionLocal
 from app.Usuario.routes import router as usuario_router
 from app.Vacina.routes import router as vacina_router
 from app.HistoricoVacina.routes import router as historico_router
 
+logger = logging.getLogger("imunetrack")
+
 
 def criar_tabelas_com_retry(retries=10, delay=3):
     """Cria tabelas no banco de dados com retry caso o banco ainda não esteja pronto."""
     for i in range(retries):
         try:
             Base.metadata.create_all(bind=engine)
-            print("Tabelas criadas com sucesso!")
+            logger.info("Tabelas criadas com sucesso!")
             break
         except OperationalError:
-            print(f"[{i+1}/{retries}] Banco ainda não pronto, tentando novamente em {delay}s...")
+            logger.warning(
+                "[%d/%d] Banco ainda não pronto, tentando novamente em %ds...",
+                i + 1, retries, delay
+            )
             time.sleep(delay)
     else:
         raise RuntimeError("Não foi possível conectar ao banco de dados após várias tentativas.")
 
-criar_tabelas_com_retry()
+# Nos testes as fixtures criam o esquema; importar app.main não deve
+# tocar no banco
+if ENV != "test":
+    criar_tabelas_com_retry()
 
-# Cria a aplicação FastAPI
-app = FastAPI(title="ImuneTrack API")
+# Cria a aplicação FastAPI; orjson serializa as respostas bem mais
+# rápido que o json da stdlib, o que pesa nas listagens grandes
+app = FastAPI(title="ImuneTrack API", default_response_class=ORJSONResponse)
 
 origins = [
     # Adicionar aqui a URL do Front-end:
@@ -39,6 +50,18 @@ origins = [
     "http://127.0.0.1:8000",
 ]
 
+@app.middleware("http")
+async def db_session_middleware(request, call_next):
+    """Abre uma única sessão de banco por requisição.
+
+    A sessão fica em request.state.db e é fechada aqui mesmo ao final;
+    get_db só a repassa, sem custo de gerador por dependência.
+    """
+    with SessionLocal() as session:
+        request.state.db = session
+        return await call_next(request)
+
+
 # Adiciona CORS
 app.add_middleware(
     CORSMiddleware,
@@ -1,17 +1,12 @@
 """Schemas Pydantic para validação de dados da API."""
 from datetime import datetime, date
-from enum import Enum
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field, validator
 from app.HistoricoVacina.model import StatusDose
 
-class StatusDoseEnum(str, Enum):
-    """Enum para status de doses de vacinas."""
-
-    PENDENTE = "pendente"
-    APLICADA = "aplicada"
-    ATRASADA = "atrasada"
-    CANCELADA = "cancelada"
+# Alias do enum do modelo: os schemas validam com o mesmo tipo que a
+# coluna armazena, sem reconversão de valores nas rotas
+StatusDoseEnum = StatusDose
 
 class VacinaBase(BaseModel):
     """Schema base para Vacina."""
@@ -0,0 +1,14 @@
+"""Fixtures compartilhadas por todos os módulos de teste."""
+import pytest
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def route_paths():
+    """Conjunto dos caminhos registrados na aplicação.
+
+    Calculado uma única vez por sessão a partir do schema OpenAPI, que
+    enxerga também os routers incluídos (sem .path em app.routes).
+    """
+    return set(app.openapi()["paths"])